@@ -0,0 +1,20 @@
+import random
+import secrets
+import string
+
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+_SYSTEM_RANDOM = random.SystemRandom()
+
+
+def generate_temporary_password(length: int = 12) -> str:
+    password_chars = [
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.digits),
+    ]
+    password_chars += [
+        secrets.choice(_PASSWORD_ALPHABET) for _ in range(length - len(password_chars))
+    ]
+    _SYSTEM_RANDOM.shuffle(password_chars)
+
+    return "".join(password_chars)
@@ -0,0 +1,39 @@
+from typing import List, Type, TypeVar
+
+from mongoengine import QuerySet
+from pydantic import BaseModel
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+
+def construct_responses(
+    response_model: Type[ResponseModel], infos: List[dict]
+) -> List[ResponseModel]:
+    """Build response models from trusted database documents without validation"""
+
+    fields = response_model.__fields__
+    return [
+        response_model.construct(
+            **{key: value for key, value in info.items() if key in fields}
+        )
+        for info in infos
+    ]
+
+
+def raw_infos(queryset: QuerySet) -> List[dict]:
+    """Read raw documents and fill in model defaults for fields missing from them"""
+
+    defaults = [
+        (field.db_field, field.default)
+        for field in queryset._document._fields.values()
+        if field.default is not None
+    ]
+
+    infos = []
+    for info in queryset.as_pymongo():
+        for key, default in defaults:
+            if key not in info:
+                info[key] = default() if callable(default) else default
+        infos.append(info)
+
+    return infos
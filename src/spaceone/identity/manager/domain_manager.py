@@ -32,15 +32,20 @@ class DomainManager(BaseManager):
                 f'[update_domain._rollback] Revert Data: {old_data["name"]} ({old_data["domain_id"]})'
             )
             domain_vo.update(old_data)
+            cache.delete_pattern(f"identity:domain-name:{domain_vo.domain_id}")
 
         self.transaction.add_rollback(_rollback, domain_vo.to_dict())
 
-        return domain_vo.update(params)
+        domain_vo = domain_vo.update(params)
+        cache.delete_pattern(f"identity:domain-name:{domain_vo.domain_id}")
+
+        return domain_vo
 
     @staticmethod
     def delete_domain_by_vo(domain_vo: Domain) -> None:
         domain_vo.delete()
         cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        cache.delete_pattern(f"identity:domain-name:{domain_vo.domain_id}")
 
     def enable_domain(self, domain_vo: Domain) -> Domain:
         self.update_domain_by_vo({"state": "ENABLED"}, domain_vo)
@@ -57,6 +62,11 @@ class DomainManager(BaseManager):
     def get_domain(self, domain_id: str) -> Domain:
         return self.domain_model.get(domain_id=domain_id)
 
+    @cache.cacheable(key="identity:domain-name:{domain_id}", expire=300)
+    def get_domain_name(self, domain_id: str) -> str:
+        domain_vo = self.domain_model.get(domain_id=domain_id)
+        return domain_vo.name
+
     def get_domain_by_name(self, name: str) -> Domain:
         return self.domain_model.get(name=name)
 
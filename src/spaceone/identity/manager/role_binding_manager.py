@@ -1,14 +1,22 @@
 import logging
-from typing import Tuple
+from collections import namedtuple
+from typing import List, Tuple
 
 from mongoengine import QuerySet
+from spaceone.core.error import ERROR_NOT_FOUND
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.model.role_binding.database import RoleBinding
+from spaceone.identity.model.user.database import User
+from spaceone.identity.lib.response import raw_infos
 from spaceone.identity.manager.user_group_manager import UserGroupManager
 
 _LOGGER = logging.getLogger(__name__)
 
+RoleBindingCreateContext = namedtuple(
+    "RoleBindingCreateContext", ["user_info", "role_info", "workspace_info"]
+)
+
 
 class RoleBindingManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -72,11 +80,94 @@ class RoleBindingManager(BaseManager):
 
         return self.role_binding_model.get(**conditions)
 
+    @staticmethod
+    def preload_create_context(
+        user_id: str,
+        role_id: str,
+        domain_id: str,
+        workspace_id: str = None,
+        check_workspace: bool = False,
+    ) -> RoleBindingCreateContext:
+        """Load user, role and (optional) workspace info in a single aggregate query"""
+
+        pipeline = [
+            {"$limit": 1},
+            {"$project": {"user_id": 1, "domain_id": 1, "role_type": 1, "role_id": 1}},
+            {
+                "$lookup": {
+                    "from": "role",
+                    "pipeline": [
+                        {"$match": {"role_id": role_id, "domain_id": domain_id}},
+                        {"$limit": 1},
+                        {"$project": {"role_id": 1, "role_type": 1}},
+                    ],
+                    "as": "roles",
+                }
+            },
+        ]
+
+        if check_workspace:
+            pipeline.append(
+                {
+                    "$lookup": {
+                        "from": "workspace",
+                        "pipeline": [
+                            {
+                                "$match": {
+                                    "workspace_id": workspace_id,
+                                    "domain_id": domain_id,
+                                    "state": {"$ne": "DELETED"},
+                                }
+                            },
+                            {"$limit": 1},
+                            {"$project": {"workspace_id": 1}},
+                        ],
+                        "as": "workspaces",
+                    }
+                }
+            )
+
+        user_vos = User.objects.filter(user_id=user_id, domain_id=domain_id)
+        user_info = next(user_vos.aggregate(pipeline), None)
+
+        if user_info is None:
+            raise ERROR_NOT_FOUND(
+                key=("user_id", "domain_id"), value=(user_id, domain_id)
+            )
+
+        roles_info = user_info.pop("roles")
+        workspaces_info = user_info.pop("workspaces", [])
+
+        workspace_info = None
+        if check_workspace:
+            if len(workspaces_info) == 0:
+                raise ERROR_NOT_FOUND(
+                    key=("domain_id", "workspace_id"), value=(domain_id, workspace_id)
+                )
+
+            workspace_info = workspaces_info[0]
+
+        if len(roles_info) == 0:
+            raise ERROR_NOT_FOUND(
+                key=("role_id", "domain_id"), value=(role_id, domain_id)
+            )
+
+        return RoleBindingCreateContext(user_info, roles_info[0], workspace_info)
+
     def filter_role_bindings(self, **conditions) -> QuerySet:
         return self.role_binding_model.filter(**conditions)
 
     def list_role_bindings(self, query: dict) -> Tuple[QuerySet, int]:
         return self.role_binding_model.query(**query)
 
+    def list_role_bindings_info(self, query: dict) -> Tuple[List[dict], int]:
+        rb_vos, total_count = self.role_binding_model.query(**query)
+
+        # Skip document hydration for read-only listing when a QuerySet is returned
+        if isinstance(rb_vos, QuerySet):
+            return raw_infos(rb_vos), total_count
+        else:
+            return [rb_vo.to_dict() for rb_vo in rb_vos], total_count
+
     def stat_role_bindings(self, query: dict) -> dict:
         return self.role_binding_model.stat(**query)
@@ -16,6 +16,10 @@ from spaceone.identity.model.user.database import User
 
 _LOGGER = logging.getLogger(__name__)
 
+_HAS_LOWERCASE = re.compile(r"[a-z]").search
+_HAS_UPPERCASE = re.compile(r"[A-Z]").search
+_HAS_DIGIT = re.compile(r"[0-9]").search
+
 
 class UserManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -86,13 +90,41 @@ class UserManager(BaseManager):
                 required_actions.remove("UPDATE_PASSWORD")
                 is_change_required_actions = True
 
-        if is_change_required_actions:
+        if is_change_required_actions and "required_actions" not in params:
             params["required_actions"] = required_actions
 
-        self.transaction.add_rollback(_rollback, user_vo.to_dict())
+        # Revert only the updated fields, since user_vo may be partially loaded
+        user_data = user_vo.to_dict()
+        old_data = {key: user_data.get(key) for key in params.keys()}
+        old_data["user_id"] = user_vo.user_id
+        self.transaction.add_rollback(_rollback, old_data)
 
         return user_vo.update(params)
 
+    def update_user_role_by_id(
+        self, user_id: str, domain_id: str, user_role_info: dict
+    ) -> None:
+        def _rollback(old_data):
+            _LOGGER.info(f"[update_user_role_by_id._rollback] Revert Data: {user_id}")
+            user_vos.update_one(**old_data)
+
+        user_vos = self.user_model.filter(user_id=user_id, domain_id=domain_id)
+
+        # Single $set that also returns the previous values for rollback
+        old_user_vo = user_vos.only(*user_role_info.keys()).modify(
+            **{f"set__{key}": value for key, value in user_role_info.items()}
+        )
+
+        if old_user_vo is None:
+            raise ERROR_NOT_FOUND(
+                key=("user_id", "domain_id"), value=(user_id, domain_id)
+            )
+
+        self.transaction.add_rollback(
+            _rollback,
+            {f"set__{key}": getattr(old_user_vo, key) for key in user_role_info.keys()},
+        )
+
     @staticmethod
     def delete_user_by_vo(user_vo: User) -> None:
         rb_mgr = RoleBindingManager()
@@ -148,8 +180,8 @@ class UserManager(BaseManager):
 
         user_vo.delete()
 
-    def get_user(self, user_id: str, domain_id: str) -> User:
-        return self.user_model.get(user_id=user_id, domain_id=domain_id)
+    def get_user(self, user_id: str, domain_id: str, only: list = None) -> User:
+        return self.user_model.get(user_id=user_id, domain_id=domain_id, only=only)
 
     def filter_users(self, **conditions) -> QuerySet:
         return self.user_model.filter(**conditions)
@@ -176,15 +208,15 @@ class UserManager(BaseManager):
     def _check_password_format(password: str) -> None:
         if len(password) < 8:
             raise ERROR_INCORRECT_PASSWORD_FORMAT(rule="At least 9 characters long.")
-        elif not re.search("[a-z]", password):
+        elif not _HAS_LOWERCASE(password):
             raise ERROR_INCORRECT_PASSWORD_FORMAT(
                 rule="Contains at least one lowercase character"
             )
-        elif not re.search("[A-Z]", password):
+        elif not _HAS_UPPERCASE(password):
             raise ERROR_INCORRECT_PASSWORD_FORMAT(
                 rule="Contains at least one uppercase character"
             )
-        elif not re.search("[0-9]", password):
+        elif not _HAS_DIGIT(password):
             raise ERROR_INCORRECT_PASSWORD_FORMAT(rule="Contains at least one number")
 
     @staticmethod
@@ -47,5 +47,21 @@ class RoleBinding(MongoModel):
                 ],
                 "name": "COMPOUND_INDEX_FOR_ROLE_BINDING_UPDATE",
             },
+            {
+                "fields": [
+                    "domain_id",
+                    "user_id",
+                    "role_type",
+                ],
+                "name": "COMPOUND_INDEX_FOR_USER_ROLE_TYPE",
+            },
+            {
+                "fields": [
+                    "domain_id",
+                    "user_id",
+                    "workspace_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_USER_WORKSPACE",
+            },
         ],
     }
@@ -61,5 +61,13 @@ class User(MongoModel):
         ],
         "minimal_fields": ["user_id", "name", "state", "auth_type", "role_type"],
         "ordering": ["name", "user_id"],
-        "indexes": ["user_id", "state", "auth_type", "role_type", "domain_id"],
+        "indexes": [
+            {
+                "fields": ["domain_id", "state", "role_type"],
+                "name": "COMPOUND_INDEX_FOR_ADMIN_CHECK",
+            },
+            "state",
+            "auth_type",
+            "role_type",
+        ],
     }
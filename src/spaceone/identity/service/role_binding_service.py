@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Union
 
@@ -6,6 +7,7 @@ from spaceone.core.service.utils import *
 
 from spaceone.identity.error import ERROR_NOT_ALLOWED_TO_DELETE_ROLE_BINDING
 from spaceone.identity.error.error_role import *
+from spaceone.identity.lib.response import construct_responses
 from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.manager.role_manager import RoleManager
 from spaceone.identity.manager.user_manager import UserManager
@@ -15,6 +17,28 @@ from spaceone.identity.model.role_binding.response import *
 
 _LOGGER = logging.getLogger(__name__)
 
+_ROLE_PRIORITY = {
+    "DOMAIN_ADMIN": 1,
+    "WORKSPACE_OWNER": 2,
+    "WORKSPACE_MEMBER": 3,
+    "USER": 4,
+}
+_WORKSPACE_ROLE_TYPES = frozenset(["WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
+
+
+@functools.lru_cache(maxsize=64)
+def _get_latest_role_type(before: str, after: str) -> str:
+    before_priority = _ROLE_PRIORITY.get(before, 4)
+    after_priority = _ROLE_PRIORITY.get(after, 4)
+
+    if before_priority < after_priority:
+        return before
+    else:
+        if after in _WORKSPACE_ROLE_TYPES:
+            return "USER"
+
+        return after
+
 
 @authentication_handler
 @authorization_handler
@@ -27,6 +51,7 @@ class RoleBindingService(BaseService):
         super().__init__(*args, **kwargs)
         self.role_binding_manager = RoleBindingManager()
         self.user_mgr = UserManager()
+        self.role_mgr = RoleManager()
         self.workspace_mgr = WorkspaceManager()
 
     @transaction(
@@ -63,61 +88,57 @@ class RoleBindingService(BaseService):
         workspace_group_id = params.get("workspace_group_id")
         workspace_id = params.get("workspace_id")
 
-        # Check user
-        user_vo = self.user_mgr.get_user(user_id, domain_id)
-
-        workspace_vo = None
-
-        # Check workspace
-        if resource_group == "WORKSPACE":
-            workspace_mgr = WorkspaceManager()
-            workspace_vo = workspace_mgr.get_workspace(workspace_id, domain_id)
-        else:
+        if resource_group != "WORKSPACE":
             params["workspace_id"] = "*"
             workspace_id = "*"
 
-        # Check role
-        role_mgr = RoleManager()
-        role_vo = role_mgr.get_role(role_id, domain_id)
+        # Check user, role and workspace
+        user_info, role_info, workspace_info = (
+            self.role_binding_manager.preload_create_context(
+                user_id,
+                role_id,
+                domain_id,
+                workspace_id=workspace_id,
+                check_workspace=resource_group == "WORKSPACE",
+            )
+        )
+
+        role_type = role_info.get("role_type")
 
         if resource_group == "DOMAIN":
-            if role_vo.role_type != "DOMAIN_ADMIN":
+            if role_type != "DOMAIN_ADMIN":
                 raise ERROR_NOT_ALLOWED_ROLE_TYPE(
-                    request_role_id=role_vo.role_id,
-                    request_role_type=role_vo.role_type,
+                    request_role_id=role_id,
+                    request_role_type=role_type,
                     supported_role_type="DOMAIN_ADMIN",
                 )
-            self.check_duplicate_domain_admin_role(
-                domain_id, user_id, role_vo.role_type
-            )
+            self.check_duplicate_domain_admin_role(domain_id, user_id, role_type)
         else:
-            if role_vo.role_type not in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
+            if role_type not in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
                 raise ERROR_NOT_ALLOWED_ROLE_TYPE(
-                    request_role_id=role_vo.role_id,
-                    request_role_type=role_vo.role_type,
+                    request_role_id=role_id,
+                    request_role_type=role_type,
                     supported_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
                 )
             self.check_duplicate_workspace_role(
                 domain_id, workspace_group_id, workspace_id, user_id
             )
 
-        params["role_type"] = role_vo.role_type
+        params["role_type"] = role_type
 
         # Update user role type
-        latest_role_type = self._get_latest_role_type(
-            user_vo.role_type, role_vo.role_type
-        )
+        latest_role_type = _get_latest_role_type(user_info.get("role_type"), role_type)
 
         user_role_info = {"role_type": latest_role_type}
-        if role_vo.role_type in ["DOMAIN_ADMIN"]:
-            user_role_info.update({"role_id": role_vo.role_id})
+        if role_type in ["DOMAIN_ADMIN"]:
+            user_role_info.update({"role_id": role_id})
 
-        self.user_mgr.update_user_by_vo(user_role_info, user_vo)
+        self.user_mgr.update_user_role_by_id(user_id, domain_id, user_role_info)
 
         # Create role binding
         rb_vo = self.role_binding_manager.create_role_binding(params)
 
-        if workspace_vo:
+        if workspace_info:
             self.update_workspace_user_count(domain_id, workspace_id)
 
         return rb_vo
@@ -158,8 +179,7 @@ class RoleBindingService(BaseService):
             )
 
         # Check role
-        role_mgr = RoleManager()
-        new_role_vo = role_mgr.get_role(params.role_id, params.domain_id)
+        new_role_vo = self.role_mgr.get_role(params.role_id, params.domain_id)
 
         if rb_vo.role_type in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
             if new_role_vo.role_type not in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
@@ -182,9 +202,11 @@ class RoleBindingService(BaseService):
                 supported_role_type=[rb_vo.role_type],
             )
 
-        user_vo = self.user_mgr.get_user(rb_vo.user_id, rb_vo.domain_id)
+        user_vo = self.user_mgr.get_user(
+            rb_vo.user_id, rb_vo.domain_id, only=["role_type"]
+        )
 
-        latest_role_type = self._get_latest_role_type(
+        latest_role_type = _get_latest_role_type(
             user_vo.role_type, new_role_vo.role_type
         )
 
@@ -192,7 +214,9 @@ class RoleBindingService(BaseService):
         if latest_role_type and new_role_vo.role_type in ["DOMAIN_ADMIN"]:
             user_role_info.update({"role_id": new_role_vo.role_id})
 
-        self.user_mgr.update_user_by_vo(user_role_info, user_vo)
+        self.user_mgr.update_user_role_by_id(
+            rb_vo.user_id, rb_vo.domain_id, user_role_info
+        )
 
         rb_vo = self.role_binding_manager.update_role_binding_by_vo(
             {"role_id": params.role_id, "role_type": new_role_vo.role_type}, rb_vo
@@ -242,25 +266,24 @@ class RoleBindingService(BaseService):
 
         # Update user role type
         remain_rb_vos = self.role_binding_manager.filter_role_bindings(
-            domain_id=params.domain_id, user_id=rb_vo.user_id
+            domain_id=params.domain_id,
+            user_id=rb_vo.user_id,
+            role_binding_id__ne=params.role_binding_id,
         )
 
         latest_role_type = "USER"
-        for remain_rb_vo in remain_rb_vos:
-            if remain_rb_vo.role_binding_id == params.role_binding_id:
-                continue
-
-            latest_role_type = self._get_latest_role_type(
-                latest_role_type, remain_rb_vo.role_type
+        for remain_rb_info in remain_rb_vos.only("role_type").as_pymongo():
+            latest_role_type = _get_latest_role_type(
+                latest_role_type, remain_rb_info.get("role_type")
             )
 
         user_role_info = {"role_type": latest_role_type}
         if latest_role_type == "USER":
             user_role_info.update({"role_id": None})
 
-        user_vo = self.user_mgr.get_user(rb_vo.user_id, rb_vo.domain_id)
-
-        self.user_mgr.update_user_by_vo(user_role_info, user_vo)
+        self.user_mgr.update_user_role_by_id(
+            rb_vo.user_id, rb_vo.domain_id, user_role_info
+        )
 
         if rb_vo.workspace_id:
             self.update_workspace_user_count(rb_vo.domain_id, rb_vo.workspace_id)
@@ -328,10 +351,10 @@ class RoleBindingService(BaseService):
         """
 
         query = params.query or {}
-        rb_vos, total_count = self.role_binding_manager.list_role_bindings(query)
+        rbs_info, total_count = self.role_binding_manager.list_role_bindings_info(query)
 
-        rbs_info = [rb_vo.to_dict() for rb_vo in rb_vos]
-        return RoleBindingsResponse(results=rbs_info, total_count=total_count)
+        results = construct_responses(RoleBindingResponse, rbs_info)
+        return RoleBindingsResponse.construct(results=results, total_count=total_count)
 
     @transaction(
         permission="identity:RoleBinding.read",
@@ -369,7 +392,7 @@ class RoleBindingService(BaseService):
             role_type=role_type,
         )
 
-        if rb_vos.count() > 0:
+        if rb_vos.first() is not None:
             raise ERROR_DUPLICATED_ROLE_BINDING(role_type=role_type)
 
     def check_duplicate_workspace_role(
@@ -385,7 +408,7 @@ class RoleBindingService(BaseService):
 
         rb_vos = self.role_binding_manager.filter_role_bindings(**conditions)
 
-        if rb_vos.count() >= 1:
+        if rb_vos.first() is not None:
             raise ERROR_DUPLICATED_WORKSPACE_ROLE_BINDING(
                 allowed_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
             )
@@ -430,26 +453,6 @@ class RoleBindingService(BaseService):
         if user_id == requested_user_id:
             raise ERROR_NOT_ALLOWED_TO_UPDATE_OR_DELETE_ROLE_BY_SELF()
 
-    @staticmethod
-    def _get_latest_role_type(before: str, after: str) -> str:
-        priority = {
-            "DOMAIN_ADMIN": 1,
-            "WORKSPACE_OWNER": 2,
-            "WORKSPACE_MEMBER": 3,
-            "USER": 4,
-        }
-
-        before_priority = priority.get(before, 4)
-        after_priority = priority.get(after, 4)
-
-        if before_priority < after_priority:
-            return before
-        else:
-            if after in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
-                return "USER"
-
-            return after
-
     def update_workspace_user_count(self, domain_id: str, workspace_id: str) -> None:
         workspace_vo = self.workspace_mgr.get_workspace(
             domain_id=domain_id, workspace_id=workspace_id
@@ -337,8 +337,9 @@ class TokenService(BaseService):
                 workspace_id=workspace_id,
             )
 
-        if rb_vos.count() > 0:
-            return rb_vos[0].role_type, rb_vos[0].role_id
+        rb_vo = rb_vos.first()
+        if rb_vo is not None:
+            return rb_vo.role_type, rb_vo.role_id
 
         return "USER", None
 
@@ -1,7 +1,4 @@
 import logging
-import random
-import re
-import string
 from typing import Dict, List, Union
 
 from mongoengine import QuerySet
@@ -11,6 +8,8 @@ from spaceone.core.service.utils import *
 
 from spaceone.identity.error.error_mfa import *
 from spaceone.identity.error.error_user import *
+from spaceone.identity.lib.password import generate_temporary_password
+from spaceone.identity.lib.response import construct_responses, raw_infos
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.domain_secret_manager import DomainSecretManager
 from spaceone.identity.manager.email_manager import EmailManager
@@ -32,6 +31,7 @@ from spaceone.identity.model.user_profile.request import (
 )
 from spaceone.identity.model.user_profile.response import (
     MyWorkspaceGroupsResponse,
+    MyWorkspaceResponse,
     MyWorkspacesResponse,
 )
 from spaceone.identity.service.workspace_group_service import WorkspaceGroupService
@@ -51,6 +51,9 @@ class UserProfileService(BaseService):
         self.user_mgr = UserManager()
         self.domain_mgr = DomainManager()
         self.domain_secret_mgr = DomainSecretManager()
+        self.role_mgr = RoleManager()
+        self.rb_mgr = RoleBindingManager()
+        self.workspace_mgr = WorkspaceManager()
         self.workspace_group_mgr = WorkspaceGroupManager()
         self.workspace_group_svc = WorkspaceGroupService()
 
@@ -190,10 +193,10 @@ class UserProfileService(BaseService):
             )
 
         elif reset_password_type == "PASSWORD":
-            temp_password = self._generate_temporary_password()
-            self.user_mgr.update_user_by_vo({"password": temp_password}, user_vo)
+            temp_password = generate_temporary_password()
             self.user_mgr.update_user_by_vo(
-                {"required_actions": ["UPDATE_PASSWORD"]}, user_vo
+                {"password": temp_password, "required_actions": ["UPDATE_PASSWORD"]},
+                user_vo,
             )
             console_link = self._get_console_url(domain_id)
             email_manager.send_temporary_password_email(
@@ -224,18 +227,16 @@ class UserProfileService(BaseService):
         domain_id = params.domain_id
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
-        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
+        mfa_state = user_vo.mfa.state if user_vo.mfa else "DISABLED"
 
         self._check_mfa_options(options, mfa_type)
 
-        if user_mfa.get("state", "DISABLED") == "ENABLED":
+        if mfa_state == "ENABLED":
             raise ERROR_MFA_ALREADY_ENABLED(user_id=user_id)
 
         mfa_manager = MFAManager.get_manager_by_mfa_type(mfa_type)
 
-        user_mfa["mfa_type"] = mfa_type
-        user_mfa["state"] = user_mfa.get("state", "DISABLED")
-        user_mfa["options"] = options
+        user_mfa = {"mfa_type": mfa_type, "state": mfa_state, "options": options}
 
         if mfa_type in ["EMAIL", "OTP"]:
             user_vo.mfa = mfa_manager.enable_mfa(user_id, domain_id, user_mfa, user_vo)
@@ -263,7 +264,7 @@ class UserProfileService(BaseService):
         domain_id = params.domain_id
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
-        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
+        user_mfa = self._get_user_mfa_info(user_vo)
         mfa_type = user_mfa.get("mfa_type")
 
         if user_mfa.get("state", "DISABLED") == "DISABLED" or mfa_type is None:
@@ -299,7 +300,7 @@ class UserProfileService(BaseService):
         }
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
-        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
+        user_mfa = self._get_user_mfa_info(user_vo)
         mfa_state = user_mfa.get("state", "DISABLED")
 
         if mfa_state == "DISABLED":
@@ -366,12 +367,9 @@ class UserProfileService(BaseService):
         user_id = params.user_id
         domain_id = params.domain_id
 
-        role_mgr = RoleManager()
-        rb_mgr = RoleBindingManager()
-        workspace_mgr = WorkspaceManager()
         allow_all = False
 
-        user_vo = self.user_mgr.get_user(user_id, domain_id)
+        user_vo = self.user_mgr.get_user(user_id, domain_id, only=["role_type"])
 
         if user_vo.role_type == "DOMAIN_ADMIN":
             allow_all = True
@@ -385,38 +383,42 @@ class UserProfileService(BaseService):
         if workspace_group_id:
             conditions["workspace_group_id"] = workspace_group_id
 
-        rb_vos = rb_mgr.filter_role_bindings(**conditions)
+        rb_vos = self.rb_mgr.filter_role_bindings(**conditions)
+        rbs_info = raw_infos(rb_vos)
 
         workspace_filter_conditions = {"domain_id": domain_id, "state": "ENABLED"}
         if allow_all:
             if workspace_group_id:
                 workspace_filter_conditions["workspace_group_id"] = workspace_group_id
 
-            workspace_vos = workspace_mgr.filter_workspaces(
+            workspace_vos = self.workspace_mgr.filter_workspaces(
                 **workspace_filter_conditions
             )
         else:
-            workspace_ids = list(set([rb.workspace_id for rb in rb_vos]))
+            workspace_ids = list({rb_info.get("workspace_id") for rb_info in rbs_info})
             workspace_filter_conditions["workspace_id"] = workspace_ids
-            workspace_vos = workspace_mgr.filter_workspaces(
+            workspace_vos = self.workspace_mgr.filter_workspaces(
                 **workspace_filter_conditions
             )
 
-        role_vos = role_mgr.filter_roles(
+        role_vos = self.role_mgr.filter_roles(
             domain_id=domain_id,
             role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
         )
 
         role_name_map = {role_vo.role_id: role_vo.name for role_vo in role_vos}
-        role_bindings_info_map = {rb.workspace_id: rb.to_dict() for rb in rb_vos}
+        role_bindings_info_map = {
+            rb_info.get("workspace_id"): rb_info for rb_info in rbs_info
+        }
 
-        workspaces_info = [workspace_vo.to_dict() for workspace_vo in workspace_vos]
+        workspaces_info = raw_infos(workspace_vos)
         my_workspaces_info = self._get_my_workspaces_info(
             workspaces_info, role_name_map, role_bindings_info_map
         )
 
-        return MyWorkspacesResponse(
-            results=my_workspaces_info, total_count=len(my_workspaces_info)
+        results = construct_responses(MyWorkspaceResponse, my_workspaces_info)
+        return MyWorkspacesResponse.construct(
+            results=results, total_count=len(my_workspaces_info)
         )
 
     @transaction(permission="identity:UserProfile.read", role_types=["USER"])
@@ -433,7 +435,9 @@ class UserProfileService(BaseService):
         Returns:
             MyWorkspaceGroupsResponse:
         """
-        user_vo = self.user_mgr.get_user(params.user_id, params.domain_id)
+        user_vo = self.user_mgr.get_user(
+            params.user_id, params.domain_id, only=["role_type"]
+        )
         allow_all = user_vo.role_type == "DOMAIN_ADMIN"
 
         workspace_group_infos = self._get_workspace_group_infos(params, allow_all)
@@ -457,8 +461,7 @@ class UserProfileService(BaseService):
         )
 
     def _get_domain_name(self, domain_id: str) -> str:
-        domain_vo = self.domain_mgr.get_domain(domain_id)
-        return domain_vo.name
+        return self.domain_mgr.get_domain_name(domain_id)
 
     def _issue_temporary_token(self, user_id: str, domain_id: str) -> dict:
         identity_conf = config.get_global("IDENTITY") or {}
@@ -485,9 +488,10 @@ class UserProfileService(BaseService):
             domain_id=domain_id, state="ENABLED", role_type=user_vo.role_type
         )
 
-        if user_vos.count() == 1:
-            if user_vos.first().user_id == user_vo.user_id:
-                raise ERROR_LAST_ADMIN_CANNOT_DISABLED_DELETED(user_id=user_vo.user_id)
+        admin_user_vos = list(user_vos.only("user_id").limit(2))
+
+        if len(admin_user_vos) == 1 and admin_user_vos[0].user_id == user_vo.user_id:
+            raise ERROR_LAST_ADMIN_CANNOT_DISABLED_DELETED(user_id=user_vo.user_id)
 
     def _get_console_url(self, domain_id):
         domain_name = self._get_domain_name(domain_id)
@@ -502,22 +506,6 @@ class UserProfileService(BaseService):
         elif email is None:
             raise ERROR_UNABLE_TO_RESET_PASSWORD_WITHOUT_EMAIL(user_id=user_id)
 
-    @staticmethod
-    def _generate_temporary_password():
-        while True:
-            random_password = "".join(
-                random.choice(
-                    string.ascii_uppercase + string.ascii_lowercase + string.digits
-                )
-                for _ in range(12)
-            )
-            if (
-                re.search("[a-z]", random_password)
-                and re.search("[A-Z]", random_password)
-                and re.search("[0-9]", random_password)
-            ):
-                return random_password
-
     @staticmethod
     def _get_my_workspaces_info(
         workspaces_info: list, role_name_map: dict, role_bindings_info_map: dict
@@ -553,12 +541,12 @@ class UserProfileService(BaseService):
             }
             return self.workspace_group_mgr.list_workspace_groups(query_filter)[0]
 
-    @staticmethod
     def _get_role_bindings_info(
-        params: UserProfileGetWorkspaceGroupsRequest, workspace_group_ids: List[str]
+        self,
+        params: UserProfileGetWorkspaceGroupsRequest,
+        workspace_group_ids: List[str],
     ) -> Dict[str, Dict[str, str]]:
-        rb_mgr = RoleBindingManager()
-        rb_vos = rb_mgr.filter_role_bindings(
+        rb_vos = self.rb_mgr.filter_role_bindings(
             user_id=params.user_id,
             domain_id=params.domain_id,
             workspace_group_id=workspace_group_ids,
@@ -614,6 +602,17 @@ class UserProfileService(BaseService):
 
         return my_workspace_groups_info
 
+    @staticmethod
+    def _get_user_mfa_info(user_vo: User) -> dict:
+        if user_vo.mfa is None:
+            return {}
+
+        return {
+            "state": user_vo.mfa.state,
+            "mfa_type": user_vo.mfa.mfa_type,
+            "options": dict(user_vo.mfa.options or {}),
+        }
+
     @staticmethod
     def _check_mfa_options(options, mfa_type):
         if mfa_type in ["EMAIL"] and not options:
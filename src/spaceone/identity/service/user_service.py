@@ -1,8 +1,6 @@
 import copy
 import logging
-import random
 import re
-import string
 from typing import Union
 
 from spaceone.core.service import *
@@ -11,6 +9,7 @@ from spaceone.core import config
 
 from spaceone.identity.error.error_mfa import *
 from spaceone.identity.error.error_user import *
+from spaceone.identity.lib.password import generate_temporary_password
 from spaceone.identity.manager import SecretManager
 from spaceone.identity.manager.config_manager import ConfigManager
 from spaceone.identity.manager.email_manager import EmailManager
@@ -81,7 +80,7 @@ class UserService(BaseService):
 
             email_manager = EmailManager()
 
-            temp_password = self._generate_temporary_password()
+            temp_password = generate_temporary_password()
             params["password"] = copy.deepcopy(temp_password)
             reset_password_type = config.get_global(
                 "RESET_PASSWORD_TYPE", "ACCESS_TOKEN"
@@ -171,15 +170,12 @@ class UserService(BaseService):
 
             reset_password_type = config.get_global("RESET_PASSWORD_TYPE")
             email_manager = EmailManager()
-            temp_password = self._generate_temporary_password()
+            temp_password = generate_temporary_password()
             params.password = temp_password
 
-            user_vo = self.user_mgr.update_user_by_vo(
-                params.dict(exclude_unset=True), user_vo
-            )
-            user_vo = self.user_mgr.update_user_by_vo(
-                {"required_actions": ["UPDATE_PASSWORD"]}, user_vo
-            )
+            user_params = params.dict(exclude_unset=True)
+            user_params["required_actions"] = ["UPDATE_PASSWORD"]
+            user_vo = self.user_mgr.update_user_by_vo(user_params, user_vo)
 
             if reset_password_type == "ACCESS_TOKEN":
                 token = self._issue_temporary_token(user_id, domain_id)
@@ -457,8 +453,7 @@ class UserService(BaseService):
         return self.user_mgr.stat_users(query)
 
     def _get_domain_name(self, domain_id: str) -> str:
-        domain_vo = self.domain_mgr.get_domain(domain_id)
-        return domain_vo.name
+        return self.domain_mgr.get_domain_name(domain_id)
 
     def _issue_temporary_token(
         self, user_id: str, domain_id: str, timeout: int = None
@@ -488,7 +483,9 @@ class UserService(BaseService):
             domain_id=domain_id, state="ENABLED", role_type="DOMAIN_ADMIN"
         )
 
-        if user_vos.count() == 1:
+        admin_user_vos = list(user_vos.only("user_id").limit(2))
+
+        if len(admin_user_vos) == 1 and admin_user_vos[0].user_id == user_vo.user_id:
             raise ERROR_LAST_ADMIN_CANNOT_DISABLED_DELETED(user_id=user_vo.user_id)
 
     def _get_console_url(self, domain_id):
@@ -504,22 +501,6 @@ class UserService(BaseService):
         elif not email:
             raise ERROR_UNABLE_TO_RESET_PASSWORD_WITHOUT_EMAIL(user_id=user_id)
 
-    @staticmethod
-    def _generate_temporary_password():
-        while True:
-            random_password = "".join(
-                random.choice(
-                    string.ascii_uppercase + string.ascii_lowercase + string.digits
-                )
-                for _ in range(12)
-            )
-            if (
-                re.search("[a-z]", random_password)
-                and re.search("[A-Z]", random_password)
-                and re.search("[0-9]", random_password)
-            ):
-                return random_password
-
     @staticmethod
     def _check_invite_external_user_eligibility(user_id: str, email: str) -> bool:
         rule = r"[^@]+@[^@]+\.[^@]+"